@@ -3,14 +3,334 @@ Flight Aggregator using Amadeus API
 Searches and compares flight offers from multiple airlines
 """
 
+import asyncio
+import hashlib
+import logging
 import os
+import re
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from operator import attrgetter
+
+import aiohttp
+import diskcache
+import requests
+from requests.adapters import HTTPAdapter
+from urllib.error import URLError
 from amadeus import Client, ResponseError
+import amadeus.mixins.parser
 from dotenv import load_dotenv
-from datetime import datetime
-from typing import List, Dict, Optional
+from datetime import datetime, timedelta
+from typing import List, Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True, slots=True)
+class Price:
+    """Total price of a flight offer"""
+    total: float
+    currency: Optional[str]
+
+
+@dataclass(frozen=True, slots=True)
+class Segment:
+    """One flight leg within an itinerary"""
+    departure_airport: Optional[str]
+    departure_time: Optional[str]
+    departure_terminal: Optional[str]
+    arrival_airport: Optional[str]
+    arrival_time: Optional[str]
+    arrival_terminal: Optional[str]
+    carrier: Optional[str]
+    flight_number: Optional[str]
+    aircraft: Optional[str]
+    duration: Optional[str]
+
+
+@dataclass(frozen=True, slots=True)
+class Itinerary:
+    """One journey (outbound or return) made up of segments"""
+    duration: Optional[str]
+    segments: Tuple[Segment, ...]
+
+
+@dataclass(frozen=True, slots=True)
+class FlightOffer:
+    """A parsed flight offer"""
+    id: Optional[str]
+    price: Price
+    itineraries: Tuple[Itinerary, ...]
+
+# Use a faster JSON parser for Amadeus responses if one is available.
+# The SDK decodes every response body in amadeus.mixins.parser, whose
+# Parser.__parse_json calls json.loads through that module's global;
+# swapping in orjson (or ujson) cuts parse time several-fold on large
+# flight-offer payloads. Safe: the module only uses loads, the body is
+# already a str (which orjson accepts), and decode errors of any type
+# are caught by the parser's own except handler.
+try:
+    import orjson
+    amadeus.mixins.parser.json = orjson
+except ImportError:
+    try:
+        import ujson
+        amadeus.mixins.parser.json = ujson
+    except ImportError:
+        pass  # stdlib json remains in place
+
+
+# Shared keep-alive session for the Amadeus SDK. The SDK's default
+# transport is urllib.request.urlopen, which opens a fresh TCP+TLS
+# connection per call (~2 extra round-trips each). Reusing pooled
+# connections removes that handshake from every search after the first.
+_HTTP_SESSION = requests.Session()
+_HTTP_SESSION.mount('https://', HTTPAdapter(pool_connections=4, pool_maxsize=8))
+
+
+class _PooledResponse:
+    """Duck-types the urlopen response object the Amadeus SDK parses"""
+
+    __slots__ = ('status', '_response')
+
+    def __init__(self, response):
+        self.status = response.status_code
+        self._response = response
+
+    def getheaders(self):
+        return list(self._response.headers.items())
+
+    def read(self):
+        return self._response.content
+
+
+def _pooled_urlopen(http_request, timeout=30):
+    """
+    urlopen-compatible callable backed by the shared keep-alive session
+
+    Passed to the Amadeus Client via its ``http`` option so SDK calls
+    reuse pooled connections. Transport failures are re-raised as
+    URLError, which the SDK maps to NetworkError just like urlopen's.
+    """
+    try:
+        response = _HTTP_SESSION.request(
+            http_request.get_method(),
+            http_request.full_url,
+            data=http_request.data,
+            headers=dict(http_request.header_items()),
+            timeout=timeout
+        )
+    except requests.RequestException as exception:
+        raise URLError(exception)
+    return _PooledResponse(response)
+
+
+# Base URL for direct REST calls in the async search path (the sync path
+# goes through the Amadeus SDK). Matches the SDK's default test environment.
+AMADEUS_BASE_URL = os.getenv('AMADEUS_BASE_URL', 'https://test.api.amadeus.com')
+
+
+# In-process TTL cache for search results. Identical searches within the TTL
+# window skip the Amadeus API entirely (flight offers change slowly enough
+# that a short TTL is safe, and it saves both latency and API quota).
+SEARCH_TTL = 600  # seconds
+SEARCH_CACHE_MAXSIZE = 128
+
+# Precompiled validators: reject malformed input before it costs an API
+# call (and a QPS quota slot)
+_IATA_RE = re.compile(r'\A[A-Z]{3}\Z')
+_DATE_RE = re.compile(r'\A\d{4}-\d{2}-\d{2}\Z')
+
+# Always request the API's result cap and slice for the caller: searches
+# that differ only in max_results then share one cache entry
+API_MAX_RESULTS = 50
+
+# Bound on the per-instance parse_flight_offer memo
+PARSED_CACHE_MAXSIZE = 256
+
+# SQLite-backed cache so warm results survive process restarts
+DISK_CACHE_DIR = os.path.expanduser('~/.flight_aggregator_cache')
+# Adaptive TTL for the disk cache: offers for imminent departures change
+# faster, so cache them for less time than offers weeks out
+DISK_TTL_IMMINENT = 300    # departure within 24 hours
+DISK_TTL_DEFAULT = 1800    # departure further out
+
+
+def _normalize_date(date_str: Optional[str]) -> Optional[str]:
+    """Canonicalize a YYYY-MM-DD date string (e.g. 2026-1-5 -> 2026-01-05)"""
+    if not date_str:
+        return None
+    try:
+        return datetime.strptime(date_str, '%Y-%m-%d').date().isoformat()
+    except ValueError:
+        return date_str  # let the API report the malformed date
+
+
+def _cache_key(
+    origin: str,
+    destination: str,
+    departure_date: str,
+    return_date: Optional[str],
+    adults: int,
+    currency: str,
+    non_stop: bool
+) -> bytes:
+    """
+    Build a compact cache key from the clamped, normalized query
+
+    Normalizing before hashing makes near-duplicate queries collide on
+    one entry: 'jfk' and 'JFK' match, adults is clamped to the API's
+    1-9 range, and max_results is deliberately excluded since every
+    search requests API_MAX_RESULTS and slices for the caller.
+    """
+    normalized = (
+        origin.upper(),
+        destination.upper(),
+        _normalize_date(departure_date),
+        _normalize_date(return_date),
+        max(1, min(adults, 9)),
+        currency.upper(),
+        bool(non_stop)
+    )
+    return hashlib.blake2b(repr(normalized).encode(), digest_size=16).digest()
+
+
+def _disk_ttl(departure_date: str) -> int:
+    """Pick a disk-cache TTL based on how soon the departure is"""
+    try:
+        departure = datetime.strptime(departure_date, '%Y-%m-%d')
+    except ValueError:
+        return DISK_TTL_IMMINENT
+    if departure - datetime.now() < timedelta(hours=24):
+        return DISK_TTL_IMMINENT
+    return DISK_TTL_DEFAULT
+
+_SEARCH_CACHE: "OrderedDict[bytes, tuple[float, List[Dict]]]" = OrderedDict()
+_SEARCH_CACHE_LOCK = threading.Lock()
+
+# Keys with a fetch currently in flight, so concurrent identical queries
+# (e.g. a prefetch racing a click) wait for one API call instead of each
+# issuing their own
+_SEARCH_INFLIGHT: Dict[bytes, threading.Event] = {}
+SEARCH_INFLIGHT_TIMEOUT = 30  # seconds a waiter will block on another fetch
+
+
+def clear_cache():
+    """Clear all cached search results"""
+    with _SEARCH_CACHE_LOCK:
+        _SEARCH_CACHE.clear()
+
+
+def _cache_store(cache_key: bytes, data: List[Dict]):
+    """Insert into the in-memory tier, evicting LRU entries past the bound"""
+    with _SEARCH_CACHE_LOCK:
+        _SEARCH_CACHE[cache_key] = (time.monotonic(), data)
+        _SEARCH_CACHE.move_to_end(cache_key)
+        while len(_SEARCH_CACHE) > SEARCH_CACHE_MAXSIZE:
+            _SEARCH_CACHE.popitem(last=False)
+
+
+_EMPTY: Dict = {}
+
+
+def _prune_offer(offer: Dict) -> Dict:
+    """
+    Keep only the offer fields the aggregator consumes
+
+    The API returns far more than we display (travelerPricings,
+    pricingOptions, fareDetailsBySegment, ...). Dropping the unused ~80%
+    right after decode shrinks both cache tiers and everything parsed
+    downstream.
+    """
+    price = offer.get('price', _EMPTY)
+    return {
+        'id': offer.get('id'),
+        'price': {
+            'total': price.get('total'),
+            'currency': price.get('currency')
+        },
+        'itineraries': [
+            {
+                'duration': itinerary.get('duration'),
+                'segments': [
+                    {
+                        'departure': segment.get('departure'),
+                        'arrival': segment.get('arrival'),
+                        'carrierCode': segment.get('carrierCode'),
+                        'number': segment.get('number'),
+                        'aircraft': segment.get('aircraft'),
+                        'duration': segment.get('duration')
+                    }
+                    for segment in itinerary.get('segments', ())
+                ]
+            }
+            for itinerary in offer.get('itineraries', ())
+        ]
+    }
+
+
+# Source dict path for each Segment field, in dataclass field order.
+# (parent key or None, leaf key) — drives the generated extractor below.
+_SEGMENT_SPEC = (
+    ('departure', 'iataCode'),
+    ('departure', 'at'),
+    ('departure', 'terminal'),
+    ('arrival', 'iataCode'),
+    ('arrival', 'at'),
+    ('arrival', 'terminal'),
+    (None, 'carrierCode'),
+    (None, 'number'),
+    ('aircraft', 'code'),
+    (None, 'duration')
+)
+
+
+def _compile_segment_parser():
+    """
+    Generate the per-segment extractor as straight-line code
+
+    Every Amadeus segment has the same fixed schema, so the extractor is
+    emitted once at import with the bound methods and sub-dict lookups
+    hoisted into locals — noticeably fewer bytecode ops per segment than
+    a chain of .get() calls, which matters at a few hundred segments per
+    50-offer response.
+    """
+    parents = sorted({parent for parent, _ in _SEGMENT_SPEC if parent})
+    lines = [
+        "def _parse_segment(segment, _Segment=Segment, _EMPTY=_EMPTY):",
+        "    get = segment.get"
+    ]
+    for parent in parents:
+        lines.append(f"    {parent} = get('{parent}', _EMPTY) or _EMPTY")
+    fields = ", ".join(
+        f"{parent}.get('{leaf}')" if parent else f"get('{leaf}')"
+        for parent, leaf in _SEGMENT_SPEC
+    )
+    lines.append(f"    return _Segment({fields})")
+
+    namespace = {'Segment': Segment, '_EMPTY': _EMPTY}
+    exec(compile('\n'.join(lines), '<segment-parser>', 'exec'), namespace)
+    return namespace['_parse_segment']
+
+
+_parse_segment = _compile_segment_parser()
 
 
 class FlightAggregator:
+    __slots__ = (
+        'amadeus',
+        '_api_key',
+        '_api_secret',
+        '_access_token',
+        '_token_expires_at',
+        '_token_lock',
+        '_token_lock_loop',
+        'disk_cache',
+        '_parsed_cache'
+    )
+
     def __init__(self):
         """Initialize the Amadeus client with API credentials"""
         load_dotenv()
@@ -23,8 +343,26 @@ class FlightAggregator:
         
         self.amadeus = Client(
             client_id=api_key,
-            client_secret=api_secret
+            client_secret=api_secret,
+            http=_pooled_urlopen
         )
+
+        # Credentials and cached OAuth token for the direct async REST path
+        self._api_key = api_key
+        self._api_secret = api_secret
+        self._access_token = None
+        self._token_expires_at = 0.0
+        self._token_lock = None
+        self._token_lock_loop = None
+
+        # Persistent cache: warm results survive GUI/CLI restarts
+        self.disk_cache = diskcache.Cache(DISK_CACHE_DIR)
+
+        # Memo for parse_flight_offer, keyed by raw-offer identity. Search
+        # cache hits hand back the same dict objects, so re-displaying or
+        # re-comparing results skips the re-parse. Values keep a strong
+        # reference to the raw offer so its id() can't be recycled.
+        self._parsed_cache: Dict[int, Tuple[Dict, FlightOffer]] = {}
     
     def search_flights(
         self,
@@ -52,88 +390,295 @@ class FlightAggregator:
         
         Returns:
             List of flight offers with details
+
+        Raises:
+            ValueError: if an airport code or date is malformed
         """
+        origin = origin.upper()
+        destination = destination.upper()
+
+        # Fail fast on malformed input instead of burning an API call
+        if not _IATA_RE.match(origin):
+            raise ValueError(f"Invalid origin airport code: {origin!r}")
+        if not _IATA_RE.match(destination):
+            raise ValueError(f"Invalid destination airport code: {destination!r}")
+        if not _DATE_RE.match(departure_date):
+            raise ValueError(f"Invalid departure date (expected YYYY-MM-DD): {departure_date!r}")
+        if return_date and not _DATE_RE.match(return_date):
+            raise ValueError(f"Invalid return date (expected YYYY-MM-DD): {return_date!r}")
+
+        # Clamp and normalize before keying so near-duplicate queries
+        # (case differences, different max_results) share one cache entry
+        adults = max(1, min(adults, 9))
+        cache_key = _cache_key(
+            origin, destination, departure_date, return_date,
+            adults, currency, non_stop
+        )
+
+        # First tier: in-memory. The in-flight map collapses concurrent
+        # identical queries onto one fetch — losers wait on the leader's
+        # Event, then find the result in the cache on re-check.
+        while True:
+            with _SEARCH_CACHE_LOCK:
+                cached = _SEARCH_CACHE.get(cache_key)
+                if cached is not None:
+                    timestamp, data = cached
+                    if time.monotonic() - timestamp < SEARCH_TTL:
+                        _SEARCH_CACHE.move_to_end(cache_key)
+                        logger.debug("Cache hit for %s -> %s (%s)", origin, destination, departure_date)
+                        return data[:max_results]
+                    del _SEARCH_CACHE[cache_key]
+
+                inflight = _SEARCH_INFLIGHT.get(cache_key)
+                if inflight is None:
+                    inflight = threading.Event()
+                    _SEARCH_INFLIGHT[cache_key] = inflight
+                    break  # this thread performs the fetch
+
+            # Another thread is already fetching this key
+            inflight.wait(SEARCH_INFLIGHT_TIMEOUT)
+
+        try:
+            return self._fetch_offers(cache_key, origin, destination, departure_date,
+                                      adults, return_date, max_results, currency, non_stop)
+        finally:
+            with _SEARCH_CACHE_LOCK:
+                _SEARCH_INFLIGHT.pop(cache_key, None)
+            inflight.set()
+
+    def _fetch_offers(
+        self,
+        cache_key: bytes,
+        origin: str,
+        destination: str,
+        departure_date: str,
+        adults: int,
+        return_date: Optional[str],
+        max_results: int,
+        currency: str,
+        non_stop: bool
+    ) -> List[Dict]:
+        """Consult the disk tier, then the API, populating both caches"""
+        # Second tier: disk cache (diskcache handles per-entry expiry)
+        disk_data = self.disk_cache.get(cache_key)
+        if disk_data is not None:
+            logger.debug("Disk cache hit for %s -> %s (%s)", origin, destination, departure_date)
+            _cache_store(cache_key, disk_data)
+            return disk_data[:max_results]
+
         try:
             params = {
                 'originLocationCode': origin,
                 'destinationLocationCode': destination,
                 'departureDate': departure_date,
                 'adults': adults,
-                'max': max_results,
+                'max': API_MAX_RESULTS,
                 'currencyCode': currency,
                 'nonStop': non_stop
             }
-            
+
             if return_date:
                 params['returnDate'] = return_date
             
-            print(f"\nAPI Request parameters: {params}")
+            logger.debug("API request parameters: %s", params)
             
             response = self.amadeus.shopping.flight_offers_search.get(**params)
             
-            print(f"API Response status: {response.status_code}")
-            print(f"Number of results: {len(response.data) if response.data else 0}")
-            
+            logger.debug(
+                "API response status: %s, results: %d",
+                response.status_code,
+                len(response.data) if response.data else 0
+            )
+
             if not response.data:
-                print("\nAPI returned empty results. This could mean:")
-                print("- No flights available for these dates")
-                print("- Invalid airport codes")
-                print("- Date is too far in the future or in the past")
-                print("- Non-stop filter is too restrictive")
-            
-            return response.data
+                logger.debug(
+                    "API returned empty results (no availability, bad airport "
+                    "codes, out-of-range date, or a too-restrictive filter)"
+                )
+                return response.data
+
+            # Drop the unused bulk of each offer before caching or returning
+            data = [_prune_offer(offer) for offer in response.data]
+
+            # Only cache successful, non-empty results
+            _cache_store(cache_key, data)
+            self.disk_cache.set(cache_key, data, expire=_disk_ttl(departure_date))
+
+            return data[:max_results]
             
         except ResponseError as error:
-            print(f"\n❌ API Error: {error}")
+            logger.error("API error: %s", error)
             if hasattr(error, 'response'):
-                print(f"Status Code: {error.response.status_code}")
-                print(f"Error Details: {error.response.body}")
+                logger.error(
+                    "Status code: %s, details: %s",
+                    error.response.status_code, error.response.body
+                )
             return []
     
-    def parse_flight_offer(self, offer: Dict) -> Dict:
+    def _get_token_lock(self) -> asyncio.Lock:
+        """Lock guarding the token fetch, recreated per event loop
+
+        asyncio.Lock binds to the loop it first awaits on, and the GUI
+        starts a fresh loop (asyncio.run) for every multi-search.
         """
-        Parse a flight offer into a more readable format
-        
+        loop = asyncio.get_running_loop()
+        if self._token_lock is None or self._token_lock_loop is not loop:
+            self._token_lock = asyncio.Lock()
+            self._token_lock_loop = loop
+        return self._token_lock
+
+    async def _get_access_token(self, session: aiohttp.ClientSession) -> str:
+        """
+        Fetch (and cache) an OAuth2 bearer token for direct REST calls
+
+        Concurrent tasks from search_many share one fetch: the first
+        through the lock POSTs to the token endpoint, the rest find the
+        cached token on re-check.
+
+        Args:
+            session: Open aiohttp client session
+
+        Returns:
+            Bearer token string
+        """
+        if self._access_token and time.monotonic() < self._token_expires_at - 60:
+            return self._access_token
+
+        async with self._get_token_lock():
+            # Re-check: another task may have fetched while we waited
+            if self._access_token and time.monotonic() < self._token_expires_at - 60:
+                return self._access_token
+
+            async with session.post(
+                f"{AMADEUS_BASE_URL}/v1/security/oauth2/token",
+                data={
+                    'grant_type': 'client_credentials',
+                    'client_id': self._api_key,
+                    'client_secret': self._api_secret
+                }
+            ) as response:
+                response.raise_for_status()
+                token_data = await response.json()
+
+            self._access_token = token_data['access_token']
+            self._token_expires_at = time.monotonic() + token_data.get('expires_in', 1799)
+            return self._access_token
+
+    async def search_flights_async(
+        self,
+        session: aiohttp.ClientSession,
+        origin: str,
+        destination: str,
+        departure_date: str,
+        adults: int = 1,
+        return_date: Optional[str] = None,
+        max_results: int = 10,
+        currency: str = "USD",
+        non_stop: bool = False
+    ) -> List[Dict]:
+        """
+        Async version of search_flights using a direct REST call
+
+        Args:
+            session: Open aiohttp client session
+            (remaining arguments match search_flights)
+
+        Returns:
+            List of flight offers with details
+        """
+        token = await self._get_access_token(session)
+
+        params = {
+            'originLocationCode': origin,
+            'destinationLocationCode': destination,
+            'departureDate': departure_date,
+            'adults': adults,
+            'max': max_results,
+            'currencyCode': currency,
+            'nonStop': 'true' if non_stop else 'false'
+        }
+
+        if return_date:
+            params['returnDate'] = return_date
+
+        async with session.get(
+            f"{AMADEUS_BASE_URL}/v2/shopping/flight-offers",
+            params=params,
+            headers={'Authorization': f"Bearer {token}"}
+        ) as response:
+            response.raise_for_status()
+            body = await response.json()
+
+        return [_prune_offer(offer) for offer in body.get('data', [])]
+
+    async def search_many(self, queries: List[Dict]) -> List[List[Dict]]:
+        """
+        Run multiple flight searches concurrently
+
+        All searches share one HTTP session and fire at the same time, so
+        total wall time is roughly the slowest single search rather than
+        the sum of all of them.
+
+        Args:
+            queries: List of keyword-argument dicts for search_flights_async
+                     (e.g. [{'origin': 'JFK', 'destination': 'LAX', ...}, ...])
+
+        Returns:
+            One result list per query, in order. Failed searches yield the
+            exception in place of a list.
+        """
+        async with aiohttp.ClientSession() as session:
+            tasks = [
+                asyncio.ensure_future(self.search_flights_async(session, **query))
+                for query in queries
+            ]
+            return await asyncio.gather(*tasks, return_exceptions=True)
+
+    def parse_flight_offer(self, offer: Dict) -> FlightOffer:
+        """
+        Parse a raw flight offer into a compact FlightOffer
+
+        The slotted dataclasses are several times smaller than the nested
+        dicts they replace, and attribute access in the display loops is a
+        direct slot load rather than a dict probe.
+
         Args:
             offer: Raw flight offer from Amadeus API
-        
+
         Returns:
             Parsed flight information
         """
-        parsed = {
-            'id': offer.get('id'),
-            'price': {
-                'total': offer.get('price', {}).get('total'),
-                'currency': offer.get('price', {}).get('currency')
-            },
-            'itineraries': []
-        }
-        
-        for itinerary in offer.get('itineraries', []):
-            segments = []
-            for segment in itinerary.get('segments', []):
-                segments.append({
-                    'departure': {
-                        'airport': segment.get('departure', {}).get('iataCode'),
-                        'time': segment.get('departure', {}).get('at'),
-                        'terminal': segment.get('departure', {}).get('terminal')
-                    },
-                    'arrival': {
-                        'airport': segment.get('arrival', {}).get('iataCode'),
-                        'time': segment.get('arrival', {}).get('at'),
-                        'terminal': segment.get('arrival', {}).get('terminal')
-                    },
-                    'carrier': segment.get('carrierCode'),
-                    'flight_number': segment.get('number'),
-                    'aircraft': segment.get('aircraft', {}).get('code'),
-                    'duration': segment.get('duration')
-                })
-            
-            parsed['itineraries'].append({
-                'duration': itinerary.get('duration'),
-                'segments': segments
-            })
-        
+        memo_key = id(offer)
+        hit = self._parsed_cache.get(memo_key)
+        if hit is not None and hit[0] is offer:
+            return hit[1]
+
+        price = offer.get('price', _EMPTY)
+        total = price.get('total')
+
+        itineraries = tuple(
+            Itinerary(
+                duration=itinerary.get('duration'),
+                segments=tuple(
+                    _parse_segment(segment)
+                    for segment in itinerary.get('segments', ())
+                )
+            )
+            for itinerary in offer.get('itineraries', ())
+        )
+
+        parsed = FlightOffer(
+            id=offer.get('id'),
+            price=Price(
+                total=float(total) if total is not None else 0.0,
+                currency=price.get('currency')
+            ),
+            itineraries=itineraries
+        )
+
+        if len(self._parsed_cache) >= PARSED_CACHE_MAXSIZE:
+            self._parsed_cache.clear()
+        self._parsed_cache[memo_key] = (offer, parsed)
         return parsed
     
     def compare_flights(
@@ -142,7 +687,7 @@ class FlightAggregator:
         destination: str,
         departure_date: str,
         **kwargs
-    ) -> List[Dict]:
+    ) -> List[FlightOffer]:
         """
         Search and compare flights, returning them sorted by price
         
@@ -158,38 +703,39 @@ class FlightAggregator:
         offers = self.search_flights(origin, destination, departure_date, **kwargs)
         
         if not offers:
-            print("No flights found")
+            logger.debug("No flights found")
             return []
         
         parsed_offers = [self.parse_flight_offer(offer) for offer in offers]
         
-        # Sort by price
-        parsed_offers.sort(key=lambda x: float(x['price']['total']))
+        # Sort by price (already converted to float during parsing);
+        # attrgetter is C-implemented, so no Python callback per comparison
+        parsed_offers.sort(key=attrgetter('price.total'))
         
         return parsed_offers
     
-    def display_flight(self, flight: Dict, index: int = None):
+    def display_flight(self, flight: FlightOffer, index: int = None):
         """
         Display flight information in a readable format
-        
+
         Args:
             flight: Parsed flight offer
             index: Optional index number to display
         """
         prefix = f"{index}. " if index is not None else ""
-        print(f"\n{prefix}Flight {flight['id']}")
-        print(f"Price: {flight['price']['total']} {flight['price']['currency']}")
-        
-        for i, itinerary in enumerate(flight['itineraries']):
-            print(f"\n  {'Outbound' if i == 0 else 'Return'} Journey (Duration: {itinerary['duration']})")
-            
-            for j, segment in enumerate(itinerary['segments']):
+        print(f"\n{prefix}Flight {flight.id}")
+        print(f"Price: {flight.price.total} {flight.price.currency}")
+
+        for i, itinerary in enumerate(flight.itineraries):
+            print(f"\n  {'Outbound' if i == 0 else 'Return'} Journey (Duration: {itinerary.duration})")
+
+            for j, segment in enumerate(itinerary.segments):
                 print(f"    Segment {j+1}:")
-                print(f"      {segment['carrier']}{segment['flight_number']}")
-                print(f"      {segment['departure']['airport']} → {segment['arrival']['airport']}")
-                print(f"      Depart: {segment['departure']['time']}")
-                print(f"      Arrive: {segment['arrival']['time']}")
-                print(f"      Duration: {segment['duration']}")
+                print(f"      {segment.carrier}{segment.flight_number}")
+                print(f"      {segment.departure_airport} → {segment.arrival_airport}")
+                print(f"      Depart: {segment.departure_time}")
+                print(f"      Arrive: {segment.arrival_time}")
+                print(f"      Duration: {segment.duration}")
 
 
 def main():
@@ -3,29 +3,66 @@ Flight Aggregator GUI using Tkinter
 Interactive interface to search and compare flight offers
 """
 
+import asyncio
+import logging
+import re
 import tkinter as tk
 from tkinter import ttk, messagebox, scrolledtext
 import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from flight_aggregator import FlightAggregator
-from tkcalendar import DateEntry
+from operator import attrgetter
+
+# Heavyweight imports are deferred: tkcalendar pulls in babel's locale
+# data and flight_aggregator loads the Amadeus SDK stack, both of which
+# dominate startup time. They're imported where first needed instead.
+
+# Precompiled once; matching is cheaper than per-call conditionals in
+# bulk searches and keeps validation consistent with flight_aggregator
+_IATA_RE = re.compile(r'\A[A-Z]{3}\Z')
 
 
 class FlightSearchGUI:
+    __slots__ = (
+        'root',
+        'aggregator',
+        '_aggregator_lock',
+        '_executor',
+        '_pending_future',
+        '_prefetch_after_id',
+        'origin_entry',
+        'destination_entry',
+        'departure_cal',
+        'return_cal',
+        'return_enabled',
+        'adults_spinbox',
+        'max_results_spinbox',
+        'currency_combo',
+        'non_stop_var',
+        'non_stop_check',
+        'search_button',
+        'multi_search_button',
+        'results_text',
+        'status_label'
+    )
+
     def __init__(self, root):
         self.root = root
         self.root.title("Flight Aggregator")
         self.root.geometry("900x700")
         self.root.resizable(True, True)
         
-        # Initialize the flight aggregator
-        try:
-            self.aggregator = FlightAggregator()
-        except Exception as e:
-            messagebox.showerror("Error", f"Failed to initialize API: {e}\n\nPlease check your .env file.")
-            self.root.destroy()
-            return
-        
+        # The flight aggregator is created lazily on first search so the
+        # window appears before the API stack is imported and configured
+        self.aggregator = None
+        self._aggregator_lock = threading.Lock()
+
+        # Persistent worker pool for searches: no per-click thread creation,
+        # and a pending-future check prevents duplicate in-flight API calls
+        self._executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix='flight-search')
+        self._pending_future = None
+        self._prefetch_after_id = None
+
         # Configure style
         self.setup_styles()
         
@@ -34,6 +71,11 @@ class FlightSearchGUI:
         
         # Bind Enter key to search
         self.root.bind('<Return>', lambda e: self.search_flights())
+
+        # Speculatively warm the cache once the form looks complete, so the
+        # explicit search click often resolves from cache instantly
+        self.destination_entry.bind('<FocusOut>', self._schedule_prefetch)
+        self.departure_cal.bind('<<DateEntrySelected>>', self._schedule_prefetch)
     
     def setup_styles(self):
         """Configure the application styles"""
@@ -64,14 +106,27 @@ class FlightSearchGUI:
         # Search Form
         self.create_search_form(main_frame)
         
-        # Search Button
+        # Search Buttons
+        buttons_frame = ttk.Frame(main_frame)
+        buttons_frame.grid(row=5, column=0, columnspan=2, pady=20, sticky=(tk.W, tk.E))
+        buttons_frame.columnconfigure(0, weight=1)
+        buttons_frame.columnconfigure(1, weight=1)
+
         self.search_button = ttk.Button(
-            main_frame, 
-            text="Search Flights", 
+            buttons_frame,
+            text="Search Flights",
             command=self.search_flights,
             style='Search.TButton'
         )
-        self.search_button.grid(row=5, column=0, columnspan=2, pady=20, sticky=(tk.W, tk.E))
+        self.search_button.grid(row=0, column=0, padx=(0, 5), sticky=(tk.W, tk.E))
+
+        self.multi_search_button = ttk.Button(
+            buttons_frame,
+            text="Compare Destinations",
+            command=self.search_many_flights,
+            style='Search.TButton'
+        )
+        self.multi_search_button.grid(row=0, column=1, padx=(5, 0), sticky=(tk.W, tk.E))
         
         # Results area
         results_label = ttk.Label(main_frame, text="Search Results:", style='Header.TLabel')
@@ -91,8 +146,18 @@ class FlightSearchGUI:
         self.status_label = ttk.Label(main_frame, text="Ready", relief=tk.SUNKEN)
         self.status_label.grid(row=8, column=0, columnspan=2, sticky=(tk.W, tk.E), pady=(5, 0))
     
+    def _get_aggregator(self):
+        """Create the FlightAggregator on first use (worker threads only)"""
+        with self._aggregator_lock:
+            if self.aggregator is None:
+                from flight_aggregator import FlightAggregator
+                self.aggregator = FlightAggregator()
+            return self.aggregator
+
     def create_search_form(self, parent):
         """Create the search form fields"""
+        from tkcalendar import DateEntry
+
         row = 1
         
         # Origin with example
@@ -116,7 +181,7 @@ class FlightSearchGUI:
         self.destination_entry = ttk.Entry(dest_frame, width=40, font=('Arial', 11))
         self.destination_entry.grid(row=0, column=1, sticky=(tk.W, tk.E), padx=(10, 0))
         self.destination_entry.insert(0, "LAX")
-        ttk.Label(dest_frame, text="Examples: LAX, MIA, DFW, SEA", font=('Arial', 8), foreground='gray').grid(row=1, column=1, sticky=tk.W, padx=(10, 0))
+        ttk.Label(dest_frame, text="Examples: LAX, MIA, DFW, SEA (comma-separate to compare, e.g. LAX, SFO, SAN)", font=('Arial', 8), foreground='gray').grid(row=1, column=1, sticky=tk.W, padx=(10, 0))
         row += 1
         
         # Dates frame
@@ -204,7 +269,11 @@ class FlightSearchGUI:
         self.non_stop_check.grid(row=row, column=0, columnspan=2, sticky=tk.W, pady=10)
     
     def search_flights(self):
-        """Perform flight search in a separate thread"""
+        """Perform flight search on the worker pool"""
+        # Ignore clicks while a search is already in flight
+        if self._pending_future is not None and not self._pending_future.done():
+            return
+
         # Validate inputs
         origin = self.origin_entry.get().strip().upper()
         destination = self.destination_entry.get().strip().upper()
@@ -213,7 +282,7 @@ class FlightSearchGUI:
             messagebox.showwarning("Input Error", "Please fill in Origin and Destination")
             return
         
-        if len(origin) != 3 or len(destination) != 3:
+        if not _IATA_RE.match(origin) or not _IATA_RE.match(destination):
             messagebox.showwarning("Input Error", "Airport codes must be 3 letters (e.g., JFK, LAX)")
             return
         
@@ -222,11 +291,9 @@ class FlightSearchGUI:
         self.status_label.config(text="Searching flights...")
         self.results_text.delete(1.0, tk.END)
         self.results_text.insert(tk.END, "🔍 Searching for flights...\n\n")
-        
-        # Run search in separate thread to keep GUI responsive
-        thread = threading.Thread(target=self._perform_search)
-        thread.daemon = True
-        thread.start()
+
+        # Run search on the worker pool to keep GUI responsive
+        self._pending_future = self._executor.submit(self._perform_search)
     
     def _perform_search(self):
         """Internal method to perform the actual search"""
@@ -247,7 +314,7 @@ class FlightSearchGUI:
             non_stop = self.non_stop_var.get()
             
             # Perform search
-            flights = self.aggregator.compare_flights(
+            flights = self._get_aggregator().compare_flights(
                 origin=origin,
                 destination=destination,
                 departure_date=departure_date,
@@ -264,48 +331,203 @@ class FlightSearchGUI:
         except Exception as e:
             self.root.after(0, self._display_error, str(e))
     
+    def _schedule_prefetch(self, event=None):
+        """Debounce prefetch triggers so rapid edits fire one search"""
+        if self._prefetch_after_id is not None:
+            self.root.after_cancel(self._prefetch_after_id)
+        self._prefetch_after_id = self.root.after(400, self._maybe_prefetch)
+
+    def _maybe_prefetch(self):
+        """Kick off a speculative search if the form is valid"""
+        self._prefetch_after_id = None
+
+        origin = self.origin_entry.get().strip().upper()
+        destination = self.destination_entry.get().strip().upper()
+        if not _IATA_RE.match(origin) or not _IATA_RE.match(destination):
+            return
+
+        # Never compete with an explicit search
+        if self._pending_future is not None and not self._pending_future.done():
+            return
+
+        return_date = None
+        if self.return_enabled.get():
+            return_date = self.return_cal.get_date().strftime('%Y-%m-%d')
+
+        self._executor.submit(
+            self._prefetch_search,
+            origin=origin,
+            destination=destination,
+            departure_date=self.departure_cal.get_date().strftime('%Y-%m-%d'),
+            return_date=return_date,
+            adults=int(self.adults_spinbox.get()),
+            currency=self.currency_combo.get(),
+            non_stop=self.non_stop_var.get()
+        )
+
+    def _prefetch_search(self, **params):
+        """Warm the search cache in the background; failures are ignored"""
+        try:
+            self._get_aggregator().search_flights(**params)
+        except Exception:
+            pass  # speculative only — the explicit search will surface errors
+
+    def search_many_flights(self):
+        """Search several destinations concurrently and compare results"""
+        # Ignore clicks while a search is already in flight
+        if self._pending_future is not None and not self._pending_future.done():
+            return
+
+        origin = self.origin_entry.get().strip().upper()
+        destinations = [d.strip().upper() for d in self.destination_entry.get().split(',') if d.strip()]
+
+        if not origin or not destinations:
+            messagebox.showwarning("Input Error", "Please fill in Origin and Destination(s)")
+            return
+
+        if not _IATA_RE.match(origin) or any(not _IATA_RE.match(d) for d in destinations):
+            messagebox.showwarning("Input Error", "Airport codes must be 3 letters (e.g., JFK, LAX)")
+            return
+
+        # Disable search buttons during search
+        self.search_button.config(state='disabled')
+        self.multi_search_button.config(state='disabled')
+        self.status_label.config(text=f"Searching {len(destinations)} destinations...")
+        self.results_text.delete(1.0, tk.END)
+        self.results_text.insert(tk.END, f"🔍 Searching {origin} → {', '.join(destinations)}...\n\n")
+
+        # Run search on the worker pool to keep GUI responsive
+        self._pending_future = self._executor.submit(self._perform_multi_search, origin, destinations)
+
+    def _perform_multi_search(self, origin, destinations):
+        """Internal method to run the concurrent multi-destination search"""
+        try:
+            departure_date = self.departure_cal.get_date().strftime('%Y-%m-%d')
+
+            return_date = None
+            if self.return_enabled.get():
+                return_date = self.return_cal.get_date().strftime('%Y-%m-%d')
+
+            adults = int(self.adults_spinbox.get())
+            max_results = int(self.max_results_spinbox.get())
+            currency = self.currency_combo.get()
+            non_stop = self.non_stop_var.get()
+
+            queries = [
+                {
+                    'origin': origin,
+                    'destination': destination,
+                    'departure_date': departure_date,
+                    'return_date': return_date,
+                    'adults': adults,
+                    'max_results': max_results,
+                    'currency': currency,
+                    'non_stop': non_stop
+                }
+                for destination in destinations
+            ]
+
+            # All searches run concurrently; wall time ~ slowest single search
+            aggregator = self._get_aggregator()
+            results = asyncio.run(aggregator.search_many(queries))
+
+            # Parse and sort each destination's offers
+            parsed_results = []
+            for destination, result in zip(destinations, results):
+                if isinstance(result, Exception):
+                    parsed_results.append((destination, result))
+                else:
+                    parsed = [aggregator.parse_flight_offer(offer) for offer in result]
+                    parsed.sort(key=attrgetter('price.total'))
+                    parsed_results.append((destination, parsed))
+
+            # Update GUI in main thread
+            self.root.after(0, self._display_multi_results, origin, parsed_results)
+
+        except Exception as e:
+            self.root.after(0, self._display_error, str(e))
+
+    def _display_multi_results(self, origin, parsed_results):
+        """Display grouped multi-destination results in the GUI"""
+        # Build the whole view as one string; each Tk insert crosses the
+        # Python->Tcl boundary and triggers a reflow, so one call beats
+        # hundreds of small ones
+        buf = []
+        total_found = 0
+        for destination, flights in parsed_results:
+            buf.append(f"═══ {origin} → {destination} ═══\n\n")
+
+            if isinstance(flights, Exception):
+                buf.append(f"❌ Search failed: {flights}\n\n")
+            elif not flights:
+                buf.append("❌ No flights found.\n\n")
+            else:
+                total_found += len(flights)
+                for i, flight in enumerate(flights, 1):
+                    buf.append(self._format_flight(flight, i))
+                    buf.append("-" * 80 + "\n\n")
+
+        self.results_text.delete(1.0, tk.END)
+        self.results_text.insert(tk.END, ''.join(buf))
+
+        self.status_label.config(text=f"Found {total_found} flights across {len(parsed_results)} destinations")
+
+        # Re-enable search buttons
+        self.search_button.config(state='normal')
+        self.multi_search_button.config(state='normal')
+
     def _display_results(self, flights):
         """Display search results in the GUI"""
-        self.results_text.delete(1.0, tk.END)
-        
         if not flights:
-            self.results_text.insert(tk.END, "❌ No flights found.\n\n")
-            self.results_text.insert(tk.END, "Possible reasons:\n")
-            self.results_text.insert(tk.END, "• Invalid airport codes\n")
-            self.results_text.insert(tk.END, "• No flights available for selected dates\n")
-            self.results_text.insert(tk.END, "• Date is in the past\n")
-            self.results_text.insert(tk.END, "• Non-stop filter is too restrictive\n")
+            buf = [
+                "❌ No flights found.\n\n",
+                "Possible reasons:\n",
+                "• Invalid airport codes\n",
+                "• No flights available for selected dates\n",
+                "• Date is in the past\n",
+                "• Non-stop filter is too restrictive\n"
+            ]
             self.status_label.config(text="No flights found")
         else:
-            self.results_text.insert(tk.END, f"✅ Found {len(flights)} flights (sorted by price)\n")
-            self.results_text.insert(tk.END, "=" * 80 + "\n\n")
-            
+            buf = [
+                f"✅ Found {len(flights)} flights (sorted by price)\n",
+                "=" * 80 + "\n\n"
+            ]
+
             for i, flight in enumerate(flights, 1):
-                self._format_flight(flight, i)
-                self.results_text.insert(tk.END, "-" * 80 + "\n\n")
-            
+                buf.append(self._format_flight(flight, i))
+                buf.append("-" * 80 + "\n\n")
+
             self.status_label.config(text=f"Found {len(flights)} flights")
+
+        # Single insert call: building the view as a string is far cheaper
+        # than one Tcl round-trip (and widget reflow) per line
+        self.results_text.delete(1.0, tk.END)
+        self.results_text.insert(tk.END, ''.join(buf))
         
-        # Re-enable search button
+        # Re-enable search buttons
         self.search_button.config(state='normal')
-    
+        self.multi_search_button.config(state='normal')
+
     def _format_flight(self, flight, index):
-        """Format a single flight for display"""
-        self.results_text.insert(tk.END, f"Flight #{index}\n", 'bold')
-        self.results_text.insert(tk.END, f"💰 Price: {flight['price']['total']} {flight['price']['currency']}\n\n")
-        
-        for i, itinerary in enumerate(flight['itineraries']):
+        """Format a single flight for display, returning the text block"""
+        buf = [f"Flight #{index}\n"]
+        buf.append(f"💰 Price: {flight.price.total} {flight.price.currency}\n\n")
+
+        for i, itinerary in enumerate(flight.itineraries):
             trip_type = "🛫 Outbound" if i == 0 else "🛬 Return"
-            self.results_text.insert(tk.END, f"{trip_type} Journey (Duration: {itinerary['duration']})\n")
-            
-            for j, segment in enumerate(itinerary['segments']):
-                self.results_text.insert(tk.END, f"  ✈️  Segment {j+1}: ")
-                self.results_text.insert(tk.END, f"{segment['carrier']}{segment['flight_number']}\n")
-                self.results_text.insert(tk.END, f"      {segment['departure']['airport']} → {segment['arrival']['airport']}\n")
-                self.results_text.insert(tk.END, f"      Depart: {segment['departure']['time']}\n")
-                self.results_text.insert(tk.END, f"      Arrive: {segment['arrival']['time']}\n")
-                self.results_text.insert(tk.END, f"      Duration: {segment['duration']}\n")
-            self.results_text.insert(tk.END, "\n")
+            buf.append(f"{trip_type} Journey (Duration: {itinerary.duration})\n")
+
+            for j, segment in enumerate(itinerary.segments):
+                buf.append(f"  ✈️  Segment {j+1}: ")
+                buf.append(f"{segment.carrier}{segment.flight_number}\n")
+                buf.append(f"      {segment.departure_airport} → {segment.arrival_airport}\n")
+                buf.append(f"      Depart: {segment.departure_time}\n")
+                buf.append(f"      Arrive: {segment.arrival_time}\n")
+                buf.append(f"      Duration: {segment.duration}\n")
+            buf.append("\n")
+
+        return ''.join(buf)
     
     def _display_error(self, error_message):
         """Display error message in the GUI"""
@@ -313,10 +535,15 @@ class FlightSearchGUI:
         self.results_text.insert(tk.END, f"❌ Error: {error_message}\n")
         self.status_label.config(text="Error occurred")
         self.search_button.config(state='normal')
+        self.multi_search_button.config(state='normal')
 
 
 def main():
     """Launch the GUI application"""
+    # Diagnostics from flight_aggregator are DEBUG-level; keep them off in
+    # normal GUI runs so the hot search path does no console I/O
+    logging.basicConfig(level=logging.WARNING)
+
     root = tk.Tk()
     app = FlightSearchGUI(root)
     root.mainloop()